@@ -6,15 +6,29 @@ interface is also supplied so the script can be executed directly.
 """
 from __future__ import annotations
 
-from typing import Iterable, Sequence
+import functools
+import math
+import sys
+from typing import TYPE_CHECKING, Iterable, Literal, Sequence, overload
 
+if TYPE_CHECKING:
+    import argparse
+
+    import numpy as np
 
-def sum_five(values: Sequence[float]) -> float:
+
+# ``exact`` is deliberately not keyword-only: on CPython 3.11 a keyword-only
+# default keeps calls from taking the specialised fast path.
+def sum_five(values: Sequence[float], exact: bool = False) -> float:
     """Return the sum of exactly five numeric values.
 
     Args:
         values: A sequence containing five numeric values.  The values may be
             any type that supports addition (int, float, Decimal, etc.).
+        exact: If true, use :func:`math.fsum` to return the correctly rounded
+            floating point sum instead of adding the values left to right.
+            The result is then always a ``float``, even for ``Decimal``
+            inputs.
 
     Returns:
         The arithmetic sum of the provided values.
@@ -24,22 +38,64 @@ def sum_five(values: Sequence[float]) -> float:
     """
     if len(values) != 5:
         raise ValueError("sum_five requires exactly five values")
+    if exact:
+        return math.fsum(values)
     return sum(values)
 
 
-def parse_numbers(raw_values: Iterable[str]) -> list[float]:
-    """Convert an iterable of strings to floating point numbers."""
-    numbers: list[float] = []
-    for item in raw_values:
-        try:
-            numbers.append(float(item))
-        except ValueError as exc:  # pragma: no cover - defensive branch
-            raise ValueError(f"Could not parse '{item}' as a number") from exc
-    return numbers
+@overload
+def parse_numbers(
+    raw_values: Iterable[str], *, as_array: Literal[False] = ...
+) -> list[float]: ...
 
 
-def main(argv: Sequence[str] | None = None) -> None:
-    """Entry point for the command line interface."""
+@overload
+def parse_numbers(
+    raw_values: Iterable[str], *, as_array: Literal[True]
+) -> np.ndarray: ...
+
+
+@overload
+def parse_numbers(
+    raw_values: Iterable[str], *, as_array: bool
+) -> list[float] | np.ndarray: ...
+
+
+def parse_numbers(
+    raw_values: Iterable[str], *, as_array: bool = False
+) -> list[float] | np.ndarray:
+    """Convert an iterable of strings to floating point numbers.
+
+    Returns a ``list[float]`` by default, or a ``float64`` NumPy array when
+    ``as_array`` is true.
+    """
+    items = list(raw_values)
+    try:
+        if as_array:
+            import numpy as np
+
+            return np.fromiter(
+                map(float, items), dtype=np.float64, count=len(items)
+            )
+        return list(map(float, items))
+    except ValueError:
+        # Only rescan item by item on failure, to name the offending value.
+        for item in items:
+            try:
+                float(item)
+            except ValueError as exc:
+                message = f"Could not parse '{item}' as a number"
+                raise ValueError(message) from exc
+        raise
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> argparse.ArgumentParser:
+    """Return the argument parser used by :func:`main`.
+
+    The parser is built, and :mod:`argparse` imported, only the first time
+    :func:`main` needs it; later calls reuse the same instance.
+    """
     import argparse
 
     parser = argparse.ArgumentParser(description="Sum exactly five numbers.")
@@ -50,9 +106,44 @@ def main(argv: Sequence[str] | None = None) -> None:
         nargs=5,
         help="Five numeric values to sum",
     )
+    return parser
+
 
-    args = parser.parse_args(argv)
-    total = sum_five(args.numbers)
+def _is_negative_number(arg: str) -> bool:
+    """Return whether argparse would treat ``arg`` as a negative number."""
+    whole, dot, fraction = arg[1:].partition(".")
+    if dot:
+        return fraction.isdecimal() and (not whole or whole.isdecimal())
+    return whole.isdecimal()
+
+
+def _parse_plain_numbers(argv: Sequence[str]) -> list[float] | None:
+    """Parse ``argv`` without argparse when it is exactly five plain numbers.
+
+    Returns ``None`` for anything else (help flags, options, unparseable
+    values or the wrong count) so that argparse can handle it as usual.
+    """
+    if len(argv) != 5:
+        return None
+    numbers: list[float] = []
+    for arg in argv:
+        if arg.startswith("-") and not _is_negative_number(arg):
+            return None
+        try:
+            numbers.append(float(arg))
+        except ValueError:
+            return None
+    return numbers
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Entry point for the command line interface."""
+    if argv is None:
+        argv = sys.argv[1:]
+    numbers = _parse_plain_numbers(argv)
+    if numbers is None:
+        numbers = _build_parser().parse_args(argv).numbers
+    total = sum_five(numbers)
     print(total)
 
 
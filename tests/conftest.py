@@ -0,0 +1,9 @@
+"""Make the top-level ``sum_five`` module importable from the tests."""
+from __future__ import annotations
+
+import os
+import sys
+
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
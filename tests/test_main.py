@@ -0,0 +1,69 @@
+"""Tests for the :func:`sum_five.main` command line interface."""
+from __future__ import annotations
+
+import pytest
+
+import sum_five
+from sum_five import _build_parser, _parse_plain_numbers, main
+
+
+def _parse_with_argparse(argv: list[str]) -> list[float] | None:
+    try:
+        numbers: list[float] = _build_parser().parse_args(argv).numbers
+    except SystemExit:
+        return None
+    return numbers
+
+
+@pytest.mark.parametrize(
+    ("token", "takes_fast_path"),
+    [
+        ("1", True),
+        ("-1", True),
+        ("-.5", True),
+        ("nan", True),
+        ("-1.", False),
+        ("-1e3", False),
+        ("-", False),
+        ("--", False),
+        ("-h", False),
+        ("-5 ", False),
+        ("x", False),
+    ],
+)
+def test_plain_number_parsing_matches_argparse(
+    token: str, takes_fast_path: bool, capsys: pytest.CaptureFixture[str]
+) -> None:
+    argv = [token, "1", "2", "3", "4"]
+    fast = _parse_plain_numbers(argv)
+    assert (fast is not None) is takes_fast_path
+    if fast is not None:
+        # repr() so that NaN compares equal to itself.
+        assert repr(fast) == repr(_parse_with_argparse(argv))
+
+
+def test_main_prints_sum_without_argparse(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    def fail() -> None:
+        raise AssertionError("argparse should not be needed")
+
+    monkeypatch.setattr(sum_five, "_build_parser", fail)
+    main(["1", "2", "3", "4", "-5"])
+    assert capsys.readouterr().out == "5.0\n"
+
+
+@pytest.mark.parametrize(
+    ("argv", "message"),
+    [
+        (["1", "2", "3", "4"], "the following arguments are required"),
+        (["1", "2", "3", "4", "x"], "invalid float value: 'x'"),
+    ],
+)
+def test_main_falls_back_to_argparse_errors(
+    argv: list[str], message: str, capsys: pytest.CaptureFixture[str]
+) -> None:
+    with pytest.raises(SystemExit) as excinfo:
+        main(argv)
+    assert excinfo.value.code == 2
+    assert message in capsys.readouterr().err
@@ -0,0 +1,46 @@
+"""Tests for :func:`sum_five.parse_numbers`."""
+from __future__ import annotations
+
+import pytest
+
+from sum_five import parse_numbers
+
+
+@pytest.fixture(params=[False, True], ids=["list", "array"])
+def as_array(request: pytest.FixtureRequest) -> bool:
+    if request.param:
+        pytest.importorskip("numpy")
+    return bool(request.param)
+
+
+def test_parse_numbers_returns_list_of_floats() -> None:
+    result = parse_numbers(["1", " 2.5 ", "-1e3"])
+    assert result == [1.0, 2.5, -1000.0]
+    assert all(type(value) is float for value in result)
+
+
+def test_parse_numbers_as_array_returns_float64_array() -> None:
+    np = pytest.importorskip("numpy")
+    result = parse_numbers(["1", " 2.5 ", "-1e3"], as_array=True)
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == np.float64
+    assert result.tolist() == [1.0, 2.5, -1000.0]
+
+
+def test_parse_numbers_as_array_accepts_empty_input() -> None:
+    np = pytest.importorskip("numpy")
+    result = parse_numbers([], as_array=True)
+    assert result.dtype == np.float64
+    assert result.shape == (0,)
+
+
+def test_parse_numbers_names_unparseable_item(as_array: bool) -> None:
+    with pytest.raises(ValueError, match="Could not parse 'x' as a number"):
+        parse_numbers(["1", "x", "3"], as_array=as_array)
+
+
+def test_parse_numbers_rejects_none_item(as_array: bool) -> None:
+    # NumPy would otherwise turn None into NaN on the array path.
+    items = ["1", None]
+    with pytest.raises(TypeError):
+        parse_numbers(items, as_array=as_array)  # type: ignore[arg-type]
@@ -0,0 +1,46 @@
+"""Tests for :func:`sum_five.sum_five`."""
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from sum_five import sum_five
+
+
+def test_sum_five_adds_five_values() -> None:
+    assert sum_five([1.0, 2.0, 3.0, 4.0, 5.5]) == 15.5
+
+
+def test_sum_five_keeps_decimal_values() -> None:
+    values = [Decimal("1.1")] * 5
+    assert sum_five(values) == Decimal("5.5")  # type: ignore[arg-type]
+
+
+def test_sum_five_exact_uses_fsum() -> None:
+    values = [1e16, 1.0, -1e16, 1.0, 0.0]
+    assert sum_five(values) == 1.0
+    assert sum_five(values, exact=True) == 2.0
+
+
+def test_sum_five_exact_returns_float_for_decimals() -> None:
+    values = [Decimal("1.1")] * 5
+    result = sum_five(values, exact=True)  # type: ignore[arg-type]
+    assert isinstance(result, float)
+    assert result == 5.5
+
+
+def test_sum_five_rejects_string() -> None:
+    with pytest.raises(TypeError):
+        sum_five("abcde")  # type: ignore[arg-type]
+
+
+def test_sum_five_rejects_generator() -> None:
+    with pytest.raises(TypeError):
+        sum_five(float(i) for i in range(5))  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("values", [[], [1.0] * 4, [1.0] * 6])
+def test_sum_five_rejects_wrong_length(values: list[float]) -> None:
+    with pytest.raises(ValueError, match="exactly five values"):
+        sum_five(values)